@@ -0,0 +1,318 @@
+"""
+Aggregations behind the dashboard charts.
+
+Aggregates are described by hashable ``Aggregate`` specs. ``compute`` takes a
+batch of specs, drops duplicates, evaluates compatible ones together (all
+column means in one ``mean()``, all group means sharing a key in one
+``groupby``) and caches each unique result per dataset version. The chart
+registry in ``charts.py`` and the named ``AGGREGATES`` served by ``api.py`` go
+through the same cache, so every session in a process (and the API, when run
+inside the Streamlit process) shares one computation per aggregate.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from data_loader import current_version, load_data
+
+# --------------------------------------------------
+# Column groups
+# --------------------------------------------------
+# Canonical names from schema.py; the loader maps them to the file headers
+STUDY_HOURS_COL = "study_hours"
+MOTIVATION_COL = "motivation"
+
+FREQ_COLS = [
+    "freq_reading", "freq_videos", "freq_practice", "freq_group",
+    "freq_summary", "freq_flashcards", "freq_teaching"
+]
+
+EFF_COLS = [
+    "eff_reading", "eff_practice", "eff_group",
+    "eff_flashcards", "eff_videos"
+]
+
+TECHNIQUE_CORR_COLS = [
+    "freq_reading", "freq_practice", "freq_group",
+    "eff_reading", "eff_practice", "eff_group"
+]
+
+CHALLENGE_COLS = ["obs_time", "obs_distraction", "obs_motivation"]
+
+CHALLENGE_LABELS = {
+    "obs_time": "Stress",
+    "obs_distraction": "Distraction",
+    MOTIVATION_COL: "Motivation",
+}
+
+
+# --------------------------------------------------
+# Generic aggregations
+# --------------------------------------------------
+def value_counts(df, column, label=None, count_label="Number of Students",
+                 sort_index=False):
+    """Counts of each answer in ``column`` as a two-column frame.
+
+    Ordered by count, or by answer when ``sort_index`` is set.
+    """
+    counts = df[column].value_counts()
+    if sort_index:
+        counts = counts.sort_index()
+    counts = counts.reset_index()
+    counts.columns = [label or column, count_label]
+    return counts
+
+
+def column_means(df, columns, label, value_label):
+    """Mean of each column in ``columns``, one row per column."""
+    return (
+        df[columns]
+        .mean()
+        .reset_index()
+        .rename(columns={"index": label, 0: value_label})
+    )
+
+
+def correlation(df, columns, labels=None):
+    """Pearson correlation matrix, optionally relabelled for display."""
+    corr = df[columns].corr()
+    if labels:
+        labels = dict(labels)
+        corr = corr.rename(index=labels, columns=labels)
+    return corr
+
+
+def groupby_mean(df, by, column):
+    """Mean of ``column`` for each value of ``by``."""
+    return df.groupby(by)[column].mean().reset_index()
+
+
+def melt(df, columns, var_name="Variable", value_name="Value"):
+    """Long-format view of ``columns`` for distribution charts."""
+    return df[columns].melt(var_name=var_name, value_name=value_name)
+
+
+def select(df, columns):
+    """Plain column subset, for charts that plot individual responses."""
+    return df[columns]
+
+
+def split_counts(df, column, sep=", ", top_n=None, other_label="Other",
+                 label="Category", count_label="Count"):
+    """Counts of the individual items in a multi-answer column.
+
+    With ``top_n`` the remaining items are folded into ``other_label``.
+    """
+    import pandas as pd
+
+    counts = df[column].str.split(sep).explode().value_counts()
+
+    if top_n is not None:
+        other_count = counts.iloc[top_n:].sum()
+        counts = counts.head(top_n)
+        if other_count > 0:
+            counts = pd.concat([counts, pd.Series({other_label: other_count})])
+
+    counts = counts.reset_index()
+    counts.columns = [label, count_label]
+    return counts
+
+
+# --------------------------------------------------
+# Aggregate specs and batched evaluation
+# --------------------------------------------------
+@dataclass(frozen=True)
+class Aggregate:
+    """Hashable description of one aggregation over the dataset.
+
+    ``op`` names one of the functions in ``OPS``; ``columns`` are its source
+    columns and ``params`` its keyword arguments as sorted ``(key, value)``
+    pairs. Build instances with ``Aggregate.of``.
+    """
+
+    op: str
+    columns: tuple
+    params: tuple = ()
+
+    @classmethod
+    def of(cls, op, *columns, **params):
+        if op not in OPS:
+            raise ValueError(f"Unknown aggregate op: {op}")
+        return cls(op, tuple(columns), tuple(sorted(params.items())))
+
+    def run(self, df):
+        return OPS[self.op](df, *self._args(), **dict(self.params))
+
+    def _args(self):
+        if self.op in _SINGLE_COLUMN_OPS:
+            return self.columns
+        return (list(self.columns),)
+
+
+OPS = {
+    "value_counts": value_counts,
+    "column_means": column_means,
+    "correlation": correlation,
+    "groupby_mean": groupby_mean,
+    "split_counts": split_counts,
+    "melt": melt,
+    "select": select,
+}
+
+# Ops whose columns are passed positionally rather than as one list
+_SINGLE_COLUMN_OPS = {"value_counts", "groupby_mean", "split_counts"}
+
+
+def _evaluate(df, aggregates):
+    """Evaluate unique aggregates, sharing passes over the data."""
+    results = {}
+
+    means = [a for a in aggregates if a.op == "column_means"]
+    if means:
+        columns = list(dict.fromkeys(c for a in means for c in a.columns))
+        all_means = df[columns].mean()
+        for agg in means:
+            params = dict(agg.params)
+            results[agg] = (
+                all_means[list(agg.columns)]
+                .reset_index()
+                .rename(columns={"index": params["label"], 0: params["value_label"]})
+            )
+
+    by_key = {}
+    for agg in aggregates:
+        if agg.op == "groupby_mean":
+            by_key.setdefault(agg.columns[0], []).append(agg)
+    for by, aggs in by_key.items():
+        columns = list(dict.fromkeys(a.columns[1] for a in aggs))
+        grouped = df.groupby(by)[columns].mean()
+        for agg in aggs:
+            results[agg] = grouped[agg.columns[1]].reset_index()
+
+    for agg in aggregates:
+        if agg not in results:
+            results[agg] = agg.run(df)
+    return results
+
+
+_CACHE_SIZE = 256
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def compute(aggregates, df=None, scope=(), version=None):
+    """Results for a batch of aggregates, keyed by ``Aggregate``.
+
+    ``df`` defaults to the dataset, reading only the columns the batch
+    needs. When passing a filtered frame, give a
+    hashable ``scope`` that identifies the filter so its results are cached
+    separately, and the ``version`` the frame was loaded from, so results
+    are never cached under a version published in between. Returned frames
+    are shared between callers; copy before mutating.
+    """
+    if df is not None and version is None:
+        raise ValueError("compute() needs the version df was loaded from")
+    version = version or current_version()
+    wanted = list(dict.fromkeys(aggregates))
+
+    with _cache_lock:
+        found = {}
+        for agg in wanted:
+            key = (version, scope, agg)
+            if key in _cache:
+                _cache.move_to_end(key)
+                found[agg] = _cache[key]
+    missing = [agg for agg in wanted if agg not in found]
+
+    if missing:
+        if df is None:
+            # Only parse the columns this batch actually reads
+            columns = dict.fromkeys(c for agg in missing for c in agg.columns)
+            df = load_data(columns=list(columns), version=version)
+        computed = _evaluate(df, missing)
+        with _cache_lock:
+            for agg, result in computed.items():
+                _cache[(version, scope, agg)] = result
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+        found.update(computed)
+
+    return found
+
+
+# --------------------------------------------------
+# Named aggregates (served by api.py)
+# --------------------------------------------------
+AGGREGATES = {
+    # Overview
+    "gender_counts": Aggregate.of("value_counts", "Gender"),
+    "level_counts": Aggregate.of("value_counts", "Level of Study"),
+    "study_hours_counts": Aggregate.of(
+        "value_counts", STUDY_HOURS_COL, label="Study Hours"
+    ),
+    # Member A
+    "technique_frequency": Aggregate.of(
+        "column_means", *FREQ_COLS,
+        label="Study Technique", value_label="Average Frequency"
+    ),
+    "technique_effectiveness": Aggregate.of(
+        "column_means", *EFF_COLS,
+        label="Study Technique", value_label="Effectiveness Score"
+    ),
+    "technique_correlation": Aggregate.of("correlation", *TECHNIQUE_CORR_COLS),
+    "study_preference_counts": Aggregate.of(
+        "value_counts", "study_preference", label="Study Preference"
+    ),
+    "study_time_counts": Aggregate.of(
+        "value_counts", "study_time", label="Study Time"
+    ),
+    # Member B
+    "challenge_means": Aggregate.of(
+        "column_means", *CHALLENGE_COLS,
+        label="Challenge", value_label="Average Level"
+    ),
+    "challenge_correlation": Aggregate.of(
+        "correlation", "obs_time", "obs_distraction", MOTIVATION_COL,
+        labels=tuple(CHALLENGE_LABELS.items())
+    ),
+    "motivation_counts": Aggregate.of(
+        "value_counts", MOTIVATION_COL, label="Motivation Level", sort_index=True
+    ),
+    "motivation_by_stress": Aggregate.of("groupby_mean", "obs_time", "obs_motivation"),
+    # Member C
+    "obstacles_effectiveness": Aggregate.of(
+        "groupby_mean", "obstacles_index", "learning_effectiveness"
+    ),
+    "support_effectiveness": Aggregate.of(
+        "groupby_mean", "support_index", "learning_effectiveness"
+    ),
+    "support_needs": Aggregate.of(
+        "split_counts", "support_needed", top_n=7, label="Support Type"
+    ),
+}
+
+
+def aggregate(name, version=None):
+    """Named aggregate for the current dataset version.
+
+    The returned frame is shared between callers; copy it before mutating.
+    """
+    if name not in AGGREGATES:
+        raise KeyError(f"Unknown aggregate: {name}")
+    agg = AGGREGATES[name]
+    return compute([agg], version=version)[agg]
+
+
+_json_cache = {}
+
+
+def aggregate_json(name, version=None):
+    """Named aggregate encoded as ``orient="split"`` JSON bytes."""
+    version = version or current_version()
+    key = (version, name)
+    if key not in _json_cache:
+        if len(_json_cache) >= _CACHE_SIZE:
+            _json_cache.clear()
+        _json_cache[key] = aggregate(name, version).to_json(orient="split").encode()
+    return _json_cache[key]
@@ -0,0 +1,175 @@
+"""
+Read-only JSON API over the dashboard aggregates.
+
+A minimal ASGI application, so other tools can fetch the numbers behind each
+chart without going through the Streamlit UI:
+
+    GET /aggregates           -> list of aggregate names + dataset version
+    GET /aggregates/<name>    -> aggregate as pandas "split" JSON
+
+Responses carry an ETag derived from the dataset version; clients sending
+``If-None-Match`` get ``304 Not Modified`` without any recomputation.
+Results come from the same per-version cache in ``analytics`` that the pages
+use, so running the API inside the Streamlit process (set
+``DASHBOARD_API_PORT``) shares one cache between both.
+
+Usage:
+    python api.py --port 8000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import threading
+
+import analytics
+import refresher
+from data_loader import current_version
+
+API_PORT_ENV = "DASHBOARD_API_PORT"
+
+_server_thread = None
+_server_lock = threading.Lock()
+
+
+def _etag(version, name):
+    return f'"{version}-{name}"'.encode()
+
+
+def _if_none_match(scope):
+    """Entity tags of ``If-None-Match``, compared weakly (``W/`` dropped)."""
+    for key, value in scope["headers"]:
+        if key == b"if-none-match":
+            return [tag.strip().removeprefix(b"W/") for tag in value.split(b",")]
+    return []
+
+
+async def _respond(send, status, body=b"", headers=(), head=False):
+    """Send a JSON response; for ``HEAD`` only the headers GET would send."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": b"" if head else body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    """ASGI entry point."""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] not in ("GET", "HEAD"):
+        await _respond(send, 405, b'{"error": "method not allowed"}',
+                       [(b"allow", b"GET, HEAD")])
+        return
+
+    path = scope["path"].rstrip("/")
+    head = scope["method"] == "HEAD"
+    version = current_version()
+
+    if path in ("", "/aggregates"):
+        body = json.dumps({
+            "version": version,
+            "aggregates": sorted(analytics.AGGREGATES),
+        }).encode()
+        await _respond(send, 200, body, head=head)
+        return
+
+    prefix = "/aggregates/"
+    name = path[len(prefix):] if path.startswith(prefix) else None
+    if name not in analytics.AGGREGATES:
+        await _respond(send, 404, b'{"error": "not found"}', head=head)
+        return
+
+    etag = _etag(version, name)
+    cache_headers = [(b"etag", etag), (b"cache-control", b"no-cache")]
+
+    if_none_match = _if_none_match(scope)
+    if etag in if_none_match or b"*" in if_none_match:
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": cache_headers,
+        })
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    # Cold aggregates touch pandas; keep that off the event loop.
+    body = await asyncio.to_thread(analytics.aggregate_json, name, version)
+    await _respond(send, 200, body, cache_headers, head=head)
+
+
+def serve(host="127.0.0.1", port=8000):
+    """Run the API in the foreground."""
+    import uvicorn
+
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+def start_in_thread(host="127.0.0.1", port=8000):
+    """Run the API on a daemon thread of the current process (idempotent).
+
+    Used from the Streamlit app so the API and the pages share caches.
+    """
+    global _server_thread
+    with _server_lock:
+        if _server_thread is not None:
+            return _server_thread
+
+        import uvicorn
+
+        server = uvicorn.Server(
+            uvicorn.Config(app, host=host, port=port, log_level="warning")
+        )
+        # Signal handlers can only be installed from the main thread.
+        server.install_signal_handlers = lambda: None
+
+        _server_thread = threading.Thread(
+            target=server.run, name="dashboard-api", daemon=True
+        )
+        _server_thread.start()
+        return _server_thread
+
+
+def start_from_env():
+    """Start the in-process API if ``DASHBOARD_API_PORT`` is set.
+
+    Skipped where ``refresher.NO_BACKGROUND_ENV`` is set.
+    """
+    port = os.environ.get(API_PORT_ENV)
+    if port and not os.environ.get(refresher.NO_BACKGROUND_ENV):
+        start_in_thread(port=int(port))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Serve the dashboard aggregates as JSON."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
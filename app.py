@@ -37,10 +37,15 @@ st.markdown("---")
 st.info("Please select a page from the sidebar to view each member’s visualization analysis.")
 
 
-import pandas as pd
+import api
+from data_loader import count_rows
 
-# Load dataset
-df = pd.read_csv("cleaned_student_study_dataset_FINAL.csv")
+# Serve the aggregates API from this process when DASHBOARD_API_PORT is set
+api.start_from_env()
+
+# The landing page only needs the respondent count; this avoids importing
+# pandas (or any plotting library) before a chart page is opened.
+respondents = count_rows()
 
 st.markdown("---")
 
@@ -87,7 +92,7 @@ st.markdown(
 st.markdown("### 📊 Dataset Overview")
 
 col1, col2, col3 = st.columns(3)
-col1.metric("Total Respondents", len(df))
+col1.metric("Total Respondents", respondents)
 col2.metric("Survey Sections", 3)
 col3.metric("Study Domain", "Education")
 
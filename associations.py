@@ -0,0 +1,145 @@
+"""
+Pairwise association between categorical survey answers.
+
+Every categorical column is integer-coded once; the contingency tables of
+*all* column pairs are then built with a single ``np.bincount`` over a shared
+index space. Each pair gets a chi-square test of independence and Cramér's V
+(0 = no association, 1 = perfect association).
+
+Results are cached per dataset version, so the matrix and every cross-tab
+are computed once per process.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import schema
+from data_loader import current_version, load_data
+
+CATEGORICAL = [
+    "Gender",
+    "Age",
+    "Level of Study",
+    "study_hours",
+    "part_time_work",
+    "study_environment",
+    "goal_setting",
+    "study_preference",
+    "study_time",
+    "sleep_hours",
+]
+
+
+@dataclass
+class Associations:
+    """Cramér's V and chi-square p-values for every pair of ``columns``.
+
+    ``tables`` maps each ``(row_column, col_column)`` pair (in ``columns``
+    order) to its contingency table as a labelled frame.
+    """
+
+    columns: list
+    cramers_v: pd.DataFrame
+    p_values: pd.DataFrame
+    tables: dict
+
+    def crosstab(self, a, b):
+        """Contingency table of ``a`` (rows) by ``b`` (columns)."""
+        if (a, b) in self.tables:
+            return self.tables[(a, b)]
+        return self.tables[(b, a)].T
+
+
+def encode(df, columns):
+    """Integer codes (``-1`` for missing) and category labels per column.
+
+    Categories follow the order declared in ``schema.py`` where there is one.
+    """
+    codes = np.empty((len(df), len(columns)), dtype=np.int64)
+    categories = []
+    for i, column in enumerate(columns):
+        declared = schema.resolve(column).values
+        cat = pd.Categorical(df[column], categories=declared) if declared else pd.Categorical(df[column])
+        codes[:, i] = cat.codes
+        categories.append(list(cat.categories))
+    return codes, categories
+
+
+def contingency_tables(codes, sizes):
+    """Contingency tables of all column pairs ``i < j`` in one bincount.
+
+    Returns ``(pairs, tables)`` with ``tables[p]`` of shape
+    ``(sizes[i], sizes[j])`` for ``pairs[p] == (i, j)``.
+    """
+    sizes = np.asarray(sizes)
+    left, right = np.triu_indices(codes.shape[1], k=1)
+    cells = sizes[left] * sizes[right]
+    offsets = np.concatenate([[0], np.cumsum(cells)[:-1]])
+
+    a = codes[:, left]
+    b = codes[:, right]
+    valid = (a >= 0) & (b >= 0)
+    index = offsets + a * sizes[right] + b
+
+    counts = np.bincount(index[valid], minlength=int(cells.sum()))
+    tables = [
+        counts[start:start + n].reshape(sizes[i], sizes[j])
+        for start, n, i, j in zip(offsets, cells, left, right)
+    ]
+    return list(zip(left.tolist(), right.tolist())), tables
+
+
+def chi_square(table):
+    """``(chi2, dof, p_value, cramers_v)`` for one contingency table.
+
+    Empty rows/columns (answers nobody gave in this pair) are ignored.
+    """
+    from scipy.stats import chi2 as chi2_dist
+
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    n = table.sum()
+    rows, cols = table.shape
+    if n == 0 or rows < 2 or cols < 2:
+        return 0.0, 0, 1.0, 0.0
+
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    chi2 = float(((table - expected) ** 2 / expected).sum())
+    dof = (rows - 1) * (cols - 1)
+    v = float(np.sqrt(chi2 / n / min(rows - 1, cols - 1)))
+    return chi2, dof, float(chi2_dist.sf(chi2, dof)), v
+
+
+@lru_cache(maxsize=8)
+def _associations(version, columns):
+    columns = list(columns)
+    codes, categories = encode(load_data(columns=columns, version=version), columns)
+    pairs, tables = contingency_tables(codes, [len(c) for c in categories])
+
+    v = np.eye(len(columns))
+    p = np.zeros((len(columns), len(columns)))
+    labelled = {}
+    for (i, j), table in zip(pairs, tables):
+        _, _, p_value, cramers_v = chi_square(table)
+        v[i, j] = v[j, i] = cramers_v
+        p[i, j] = p[j, i] = p_value
+        labelled[(columns[i], columns[j])] = pd.DataFrame(
+            table,
+            index=pd.Index(categories[i], name=columns[i]),
+            columns=pd.Index(categories[j], name=columns[j]),
+        )
+
+    return Associations(
+        columns,
+        pd.DataFrame(v, index=columns, columns=columns),
+        pd.DataFrame(p, index=columns, columns=columns),
+        labelled,
+    )
+
+
+def associations(columns=None, version=None):
+    """Association matrix for ``columns`` (default: ``CATEGORICAL``)."""
+    columns = tuple(columns or CATEGORICAL)
+    return _associations(version or current_version(), columns)
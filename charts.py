@@ -0,0 +1,410 @@
+"""
+Declarative chart registry and rendering engine for the Plotly pages.
+
+Each ``ChartSpec`` names the aggregate it plots (an ``analytics.Aggregate``),
+the Plotly Express chart type and its arguments, and the text shown around
+it. Pages only call ``render_chart(key)``. The first call on a page computes
+the aggregates of *all* charts registered for that page in one batch, so
+shared aggregates (e.g. the ``Level of Study`` counts) are computed once and
+cached per dataset version.
+
+Adding a chart means adding a spec to ``CHARTS``; no page code is copied.
+"""
+
+from dataclasses import dataclass, field
+
+import streamlit as st
+
+from analytics import (
+    AGGREGATES,
+    STUDY_HOURS_COL,
+    Aggregate,
+    compute,
+)
+from data_loader import load_data
+
+
+@dataclass
+class ChartSpec:
+    """One chart: data, Plotly Express call and surrounding text.
+
+    ``kind`` is a Plotly Express function name (``bar``, ``pie``, ``line``,
+    ``box``, ``scatter``, ``imshow``); ``args`` are passed to it and
+    ``layout`` to ``fig.update_layout``. ``heading``, ``caption`` and
+    ``notes`` (markdown) are rendered before/after the figure when given.
+    """
+
+    key: str
+    page: str
+    kind: str
+    aggregate: Aggregate
+    args: dict = field(default_factory=dict)
+    layout: dict = field(default_factory=dict)
+    heading: str = None
+    caption: str = None
+    notes: str = None
+
+
+def page_charts(page):
+    """All specs registered for ``page``, in registry order."""
+    return [spec for spec in CHARTS.values() if spec.page == page]
+
+
+def build_figure(spec, data):
+    """Plotly figure for ``spec`` from its aggregated ``data``."""
+    # Imported on first use so importing the registry stays cheap
+    import plotly.express as px
+
+    fig = getattr(px, spec.kind)(data, **spec.args)
+    if spec.layout:
+        fig.update_layout(**spec.layout)
+    return fig
+
+
+def render_chart(key, df=None, scope=(), version=None):
+    """Render one registered chart into the current Streamlit page.
+
+    ``df``/``scope``/``version`` select a filtered frame (see
+    ``analytics.compute``); all charts of the same page are aggregated
+    together on first use.
+    """
+    spec = CHARTS[key]
+    batch = [s.aggregate for s in page_charts(spec.page)]
+    data = compute(batch, df=df, scope=scope, version=version)[spec.aggregate]
+
+    if spec.heading:
+        st.subheader(spec.heading)
+
+    st.plotly_chart(build_figure(spec, data), use_container_width=True)
+
+    if spec.caption:
+        st.caption(spec.caption)
+    if spec.notes:
+        st.markdown(spec.notes)
+
+
+# Multiselect filters of the overview page, in display order
+OVERVIEW_FILTERS = ["Gender", "Level of Study"]
+
+
+def overview_defaults(df):
+    """Default selection (every answer) of each ``OVERVIEW_FILTERS`` column."""
+    return [list(df[column].unique()) for column in OVERVIEW_FILTERS]
+
+
+def overview_data(selections, version=None):
+    """Filtered frame and cache scope for the overview charts.
+
+    ``selections`` holds the chosen answers of each ``OVERVIEW_FILTERS``
+    column. The page and ``refresher.warm`` (for the default selection) both
+    build the scope here, so the warmed results are the ones the page reads.
+    """
+    df = load_data(
+        columns=[c for s in page_charts("overview") for c in s.aggregate.columns],
+        filters=[
+            (column, "in", values)
+            for column, values in zip(OVERVIEW_FILTERS, selections)
+        ],
+        version=version,
+    )
+    return df, tuple(tuple(values) for values in selections)
+
+
+# ==================================================
+# Registry
+# ==================================================
+_SPECS = [
+    # --------------------------------------------------
+    # Dataset overview (computed on the filtered frame)
+    # --------------------------------------------------
+    ChartSpec(
+        key="overview.gender",
+        page="overview",
+        kind="bar",
+        aggregate=Aggregate.of("value_counts", "Gender"),
+        args=dict(
+            x="Gender",
+            y="Number of Students",
+            text_auto=True,
+            title="Gender Distribution of Respondents",
+        ),
+        heading="1️⃣ Gender Distribution",
+        caption="This chart shows the distribution of respondents by gender.",
+    ),
+    ChartSpec(
+        key="overview.level",
+        page="overview",
+        kind="bar",
+        aggregate=Aggregate.of("value_counts", "Level of Study"),
+        args=dict(
+            x="Level of Study",
+            y="Number of Students",
+            text_auto=True,
+            title="Distribution of Students by Level of Study",
+        ),
+        heading="2️⃣ Level of Study",
+        caption="This chart presents the distribution of students by their level of study.",
+    ),
+    ChartSpec(
+        key="overview.study_hours",
+        page="overview",
+        kind="bar",
+        aggregate=Aggregate.of("value_counts", STUDY_HOURS_COL, label="Study Hours"),
+        args=dict(
+            x="Study Hours",
+            y="Number of Students",
+            text_auto=True,
+            title="Weekly Study Hours Outside of Class",
+        ),
+        layout=dict(
+            xaxis_title="Study Hours Category",
+            yaxis_title="Number of Students",
+        ),
+        heading="3️⃣ Study Hours per Week (Outside Class)",
+        caption="This chart illustrates how much time students spend studying outside of class.",
+    ),
+    # --------------------------------------------------
+    # Member A
+    # --------------------------------------------------
+    ChartSpec(
+        key="member_a.frequency",
+        page="member_a",
+        kind="bar",
+        aggregate=AGGREGATES["technique_frequency"],
+        args=dict(
+            x="Study Technique",
+            y="Average Frequency",
+            text_auto=True,
+            title="Average Frequency of Study Techniques Used by Students",
+        ),
+        layout=dict(
+            yaxis_title="Average Frequency Score (1–5)",
+            xaxis_title="",
+        ),
+        heading="1️⃣ Average Frequency of Study Techniques Used",
+        caption="This bar chart shows how often students use different study techniques on average, based on a scale from 1 to 5.",
+        notes="""
+**Key Insight:**
+* This chart shows the average frequency of study techniques used by students.
+
+* From the chart, we can see that students most frequently use summarising notes, watching videos, doing practice exercises, and reading notes.
+
+* In contrast, techniques such as flashcards and teaching others are used less often.
+
+* This suggests that students prefer familiar and independent study methods rather than more active or collaborative techniques.
+""",
+    ),
+    ChartSpec(
+        key="member_a.effectiveness",
+        page="member_a",
+        kind="bar",
+        aggregate=AGGREGATES["technique_effectiveness"],
+        args=dict(
+            x="Study Technique",
+            y="Effectiveness Score",
+            text_auto=True,
+            color="Effectiveness Score",
+            color_continuous_scale="Blues",
+            title="Perceived Effectiveness of Study Techniques",
+        ),
+        layout=dict(
+            yaxis_title="Effectiveness Score (1–5)",
+            xaxis_title="",
+        ),
+        heading="2️⃣ Perceived Effectiveness of Study Techniques",
+        caption="This bar chart shows how effective students believe each study technique is, based on a rating scale from 1 to 5.",
+        notes="""
+**Key Insight:**
+* This chart shows the perceived effectiveness of different study techniques.
+
+* From the results, practice-based learning has the highest effectiveness score, followed closely by watching educational videos and group study.
+
+* In contrast, flashcards are perceived as less effective compared to other techniques.
+
+* This indicates that students feel they learn better through active engagement, such as practicing and discussing, rather than passive memorisation
+""",
+    ),
+    ChartSpec(
+        key="member_a.correlation",
+        page="member_a",
+        kind="imshow",
+        aggregate=AGGREGATES["technique_correlation"],
+        args=dict(
+            text_auto=True,
+            color_continuous_scale="RdBu",
+            title="Correlation Between Study Technique Frequency and Effectiveness",
+        ),
+        heading="3️⃣ Relationship Between Frequency and Effectiveness",
+        caption="This heatmap shows the correlation between how often students use certain study techniques and how effective they perceive those techniques to be.",
+        notes="""
+**Key Insight:**
+* This heatmap shows the relationship between the frequency of study techniques and their perceived effectiveness.
+
+* Each cell represents the strength of the relationship between two variables, where warmer colors indicate a stronger positive correlation.
+
+* From the heatmap, we can see that practice-based learning and group study show positive correlations between frequency and effectiveness.
+
+* This means that students who use these techniques more often also tend to find them more effective.
+""",
+    ),
+    ChartSpec(
+        key="member_a.preference",
+        page="member_a",
+        kind="pie",
+        aggregate=AGGREGATES["study_preference_counts"],
+        args=dict(
+            names="Study Preference",
+            values="Number of Students",
+            title="Study Preference Distribution",
+        ),
+        heading="4️⃣ Study Preference: Alone vs With Others",
+        caption="This pie chart shows how students prefer to study.",
+        notes="""
+**Key Insight:**
+* This pie chart shows students’ preferred study style.
+
+* We can see that almost half of the students prefer switching between studying alone and studying with others, depending on the subject.
+
+* About 38% prefer studying alone, while a smaller group prefers studying mainly with peers.
+
+* This shows that most students do not rely on only one study style and tend to adapt their learning approach based on their needs
+""",
+    ),
+    ChartSpec(
+        key="member_a.study_time",
+        page="member_a",
+        kind="bar",
+        aggregate=AGGREGATES["study_time_counts"],
+        args=dict(
+            x="Study Time",
+            y="Number of Students",
+            text_auto=True,
+            title="Preferred Study Time Among Students",
+        ),
+        heading="5️⃣ Preferred Study Time",
+        caption="This bar chart shows when students prefer to study, based on their responses in the survey.",
+        notes="""
+**Key Insight:**
+* This chart shows students’ preferred study time.
+
+* We can see that most students either study late at night or do not have a fixed study time.
+
+* Fewer students prefer studying in the early morning, and only a small number study in the afternoon or evening.
+
+* This suggests that students have different daily routines and often choose study times that fit their personal schedules
+""",
+    ),
+    # --------------------------------------------------
+    # Member C
+    # --------------------------------------------------
+    ChartSpec(
+        key="member_c.obstacles",
+        page="member_c",
+        kind="bar",
+        aggregate=AGGREGATES["obstacles_effectiveness"],
+        args=dict(
+            x="obstacles_index",
+            y="learning_effectiveness",
+            labels={
+                "obstacles_index": "Level of Learning Obstacles",
+                "learning_effectiveness": "Average Learning Effectiveness",
+            },
+            title="Learning Obstacles vs Learning Effectiveness",
+        ),
+        heading="Bar Chart: Learning Obstacles vs Learning Effectiveness",
+        notes="""
+**Key Insights:**
+- Lower learning obstacles are linked to higher learning effectiveness.
+- Learning effectiveness declines as obstacles increase.
+- Moderate obstacles already show a negative impact on performance.
+- Reducing learning barriers may improve academic outcomes.
+""",
+    ),
+    ChartSpec(
+        key="member_c.support_needs",
+        page="member_c",
+        kind="pie",
+        aggregate=AGGREGATES["support_needs"],
+        args=dict(
+            names="Support Type",
+            values="Count",
+            title="Distribution of Individual Support Needs Among Students",
+        ),
+        heading="Pie Chart: Distribution of Support Needs",
+        notes="""
+**Key Insights:**
+- Academic and emotional support are the most common needs.
+- A small number of support types dominate student requirements.
+- Support needs vary across students, indicating diverse challenges.
+- Identifying key needs helps prioritize support strategies.
+""",
+    ),
+    ChartSpec(
+        key="member_c.box",
+        page="member_c",
+        kind="box",
+        aggregate=Aggregate.of("melt", "learning_effectiveness", "obstacles_index"),
+        args=dict(
+            x="Variable",
+            y="Value",
+            title="Distribution of Learning Effectiveness and Obstacles Index",
+        ),
+        heading="Box Plot: Learning Effectiveness and Obstacles Index",
+        notes="""
+**Key Insights:**
+- Learning effectiveness varies widely among students.
+- Some students perform well despite facing obstacles.
+- Obstacles index is more concentrated, showing common challenges.
+- Individual differences influence learning outcomes.
+""",
+    ),
+    ChartSpec(
+        key="member_c.support",
+        page="member_c",
+        kind="line",
+        aggregate=AGGREGATES["support_effectiveness"],
+        args=dict(
+            x="support_index",
+            y="learning_effectiveness",
+            markers=True,
+            labels={
+                "support_index": "Support System Index",
+                "learning_effectiveness": "Learning Effectiveness",
+            },
+            title="Support Systems vs Learning Effectiveness",
+        ),
+        heading="Line Chart: Support Index vs Learning Effectiveness",
+        notes="""
+**Key Insights:**
+- Learning effectiveness improves as support increases.
+- Strong support systems are linked to better performance.
+- The trend shows a positive relationship overall.
+- Support plays a crucial role in student success.
+""",
+    ),
+    ChartSpec(
+        key="member_c.sleep",
+        page="member_c",
+        kind="scatter",
+        aggregate=Aggregate.of("select", "sleep_quality", "obstacles_index"),
+        args=dict(
+            x="sleep_quality",
+            y="obstacles_index",
+            labels={
+                "sleep_quality": "Sleep Quality",
+                "obstacles_index": "Obstacles Index",
+            },
+            title="Sleep Quality vs Learning Obstacles",
+        ),
+        heading="Scatter Plot: Sleep Quality vs Learning Obstacles",
+        notes="""
+**Key Insights:**
+- Better sleep quality is associated with fewer obstacles.
+- Poor sleep is linked to higher learning challenges.
+- Sleep is an important lifestyle factor in learning.
+- Improving sleep may help reduce academic difficulties.
+""",
+    ),
+]
+
+CHARTS = {spec.key: spec for spec in _SPECS}
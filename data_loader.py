@@ -0,0 +1,326 @@
+"""
+Shared access to the cleaned survey dataset.
+
+Every page, the static exporter and the HTTP API read the data through here so
+they all see the same dataset version and share parsed copies per process.
+
+Callers declare what they need:
+
+    load_data(columns=["obs_time", "obs_distraction"],
+              filters=[("Gender", "==", "female")])
+
+Columns may be named by canonical name, alias or raw file header (see
+``schema.py``); the frame comes back labelled with the names asked for. Only
+the requested columns (plus any used by filters) are parsed, and rows are
+filtered before the frame is handed out. When a columnar snapshot built with
+``build_snapshot()`` exists for the file's version, columns and filters are
+pushed down into the Parquet reader instead of parsing the CSV.
+
+Each column is validated against the schema once per version, the first time
+it is read in full, so new projections and filter combinations do not
+re-validate columns already checked.
+
+pandas is imported on first read, not at import time, so the landing page
+can use ``count_rows`` without loading it.
+
+The first ``current_version()`` call in a process starts the background
+refresher (``refresher.py``), so scripts never start it themselves.
+"""
+
+import csv
+import operator
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+import schema
+
+DATA_FILE = "cleaned_student_study_dataset_FINAL.csv"
+DATA_PATH = Path(__file__).resolve().parent / DATA_FILE
+
+# Filter operators, in the (column, op, value) form used by pyarrow
+_FILTER_OPS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda series, values: series.isin(values),
+    "not in": lambda series, values: ~series.isin(values),
+}
+
+
+_refresher_started = False
+
+# (version, full frame or None) most recently published by the background
+# refresher; the frame is None until that version is first read.
+_published = None
+_publish_lock = threading.Lock()
+
+
+def dataset_version(path=DATA_PATH):
+    """Cheap fingerprint of the data file (mtime + size).
+
+    Used as the cache key for everything derived from the dataset, and as the
+    ETag basis in the API, so replacing the file invalidates all of it.
+    """
+    stat = Path(path).stat()
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+
+def _start_refresher():
+    global _refresher_started
+    if not _refresher_started:
+        _refresher_started = True
+        # Deferred: refresher imports this module
+        import refresher
+
+        refresher.start()
+
+
+def current_version():
+    """Version sessions should read.
+
+    This is the version last published by ``refresher`` (which keeps serving
+    it while a replacement file is loaded), or the file's own version when
+    no refresher is running. A version published without its frame is only
+    pinned once something has read it; until then there is nothing warm to
+    keep serving, so sessions follow the file.
+
+    Pages read it once per rerun and pass it to every load and aggregate, so
+    a version published mid-rerun never mixes two versions on one page.
+    """
+    _start_refresher()
+    published = _published
+    if published and published[1] is not None:
+        return published[0]
+    return dataset_version()
+
+
+def published_version():
+    """Version published by the refresher, or None if nothing was."""
+    published = _published
+    return published[0] if published else None
+
+
+def publish(version, frame=None):
+    """Make ``version`` (with its full ``frame``) the one sessions read.
+
+    A single reference swap, so readers see either the old or the new
+    version, never a mix. Without ``frame`` the version is only recorded;
+    its frame is retained when it is first read.
+    """
+    global _published
+    with _publish_lock:
+        _published = (version, frame)
+
+
+def _retain(version, frame):
+    """Keep ``frame`` as the published copy of ``version`` if it has none."""
+    global _published
+    with _publish_lock:
+        if _published and _published[0] == version and _published[1] is None:
+            _published = (version, frame)
+
+
+def _check_unchanged(version):
+    """Raise if the data file is no longer at ``version`` after reading it.
+
+    Raising keeps the read out of every cache, so contents of a replacement
+    file are never stored under the version that was asked for.
+    """
+    if dataset_version() != version:
+        raise RuntimeError(f"{DATA_FILE} changed while reading version {version}")
+
+
+def _normalize_filters(filters):
+    """Hashable, validated copy of ``filters`` keyed by file header."""
+    normalized = []
+    for column, op, value in filters or ():
+        if op not in _FILTER_OPS:
+            raise ValueError(f"Unsupported filter operator: {op!r}")
+        if op in ("in", "not in"):
+            value = tuple(value)
+        normalized.append((schema.resolve(column).header, op, value))
+    return tuple(normalized)
+
+
+def snapshot_path(version):
+    """Parquet snapshot of the data file at ``version``.
+
+    The version is part of the file name, so a snapshot is only ever read for
+    the exact file it was built from, whatever the file's mtime ordering.
+    """
+    return DATA_PATH.with_name(f"{DATA_PATH.stem}.{version}.parquet")
+
+
+def _project(df, columns, filters):
+    """Apply row filters, then keep only ``columns``."""
+    import pandas as pd
+
+    if filters:
+        mask = pd.Series(True, index=df.index)
+        for column, op, value in filters:
+            mask &= _FILTER_OPS[op](df[column], value)
+        df = df.loc[mask].reset_index(drop=True)
+
+    if columns is not None:
+        df = df[list(columns)]
+    return df
+
+
+def _read_snapshot(path, columns, filters):
+    import pandas as pd
+
+    pa_filters = [
+        (column, op, list(value) if isinstance(value, tuple) else value)
+        for column, op, value in filters
+    ]
+    return pd.read_parquet(
+        path,
+        columns=list(columns) if columns is not None else None,
+        filters=pa_filters or None,
+    )
+
+
+def _read_csv(columns, filters):
+    """Columns needed for ``columns`` and ``filters``, unfiltered."""
+    import pandas as pd
+
+    usecols = None
+    if columns is not None:
+        usecols = list(dict.fromkeys([*columns, *(c for c, _, _ in filters)]))
+    return pd.read_csv(DATA_PATH, usecols=usecols)
+
+
+@lru_cache(maxsize=8)
+def _file_headers(version):
+    """Header row of the data file at ``version``."""
+    with open(DATA_PATH, newline="", encoding="utf-8") as data_file:
+        headers = tuple(next(csv.reader(data_file)))
+    _check_unchanged(version)
+    return headers
+
+
+# (version, header) pairs already validated against the schema
+_validated = set()
+_validated_lock = threading.Lock()
+
+
+def _validate(version, df, complete):
+    """Validate the columns of ``df`` not yet validated for ``version``.
+
+    Columns are only recorded as validated when ``df`` holds every row of
+    the file (``complete``), not a filtered subset.
+    """
+    with _validated_lock:
+        pending = [h for h in df.columns if (version, h) not in _validated]
+    if not pending:
+        return
+    schema.validate(df[pending])
+    if complete:
+        with _validated_lock:
+            _validated.update((version, header) for header in pending)
+
+
+@lru_cache(maxsize=32)
+def _read_dataset(version, headers, filters):
+    published = _published
+    if published and published[0] == version and published[1] is not None:
+        # The retained frame of the published version was validated in full
+        # when it was read; projecting it needs no parse.
+        return _project(published[1], headers, filters)
+
+    file_headers = _file_headers(version)
+    schema.check_headers(file_headers, headers)
+    schema.check_headers(file_headers, [column for column, _, _ in filters])
+
+    snapshot = snapshot_path(version)
+    if snapshot.exists():
+        try:
+            df = _read_snapshot(snapshot, headers, filters)
+        except ImportError:
+            # No Parquet engine installed; the CSV path gives the same result.
+            pass
+        else:
+            _validate(version, df, complete=not filters)
+            return df
+
+    df = _read_csv(headers, filters)
+    _check_unchanged(version)
+    _validate(version, df, complete=True)
+    return _project(df, headers, filters)
+
+
+def load_data(columns=None, filters=None, version=None):
+    """Return the dataset for ``version`` (default: ``current_version()``).
+
+    ``columns`` selects the columns returned (in the given order); ``filters``
+    is a list of ``(column, op, value)`` row predicates combined with AND.
+    Results are cached per version/projection/filter and shared between
+    callers, so treat them as read-only. Raises ``schema.SchemaError`` if the
+    file does not match the schema.
+    """
+    version = version or current_version()
+    published = _published
+    if published and published[0] == version and published[1] is None:
+        # First read of the recorded version: keep its full frame so it can
+        # still be served after the file is replaced.
+        _retain(version, _read_dataset(version, None, ()))
+
+    filters = _normalize_filters(filters)
+    if columns is None:
+        return _read_dataset(version, None, filters)
+
+    columns = list(dict.fromkeys(columns))
+    headers = schema.headers(columns)
+    unique_headers = tuple(dict.fromkeys(headers))
+    df = _read_dataset(version, unique_headers, filters)
+    if headers != columns:
+        if len(unique_headers) != len(headers):
+            # Two requested names are aliases of the same column
+            df = df[headers]
+        # Relabel to the requested names; shares the cached frame's data.
+        df = schema.view(df, columns)
+    return df
+
+
+@lru_cache(maxsize=4)
+def _count_rows(version):
+    with open(DATA_PATH, newline="", encoding="utf-8") as data_file:
+        rows = sum(1 for _ in csv.reader(data_file)) - 1
+    _check_unchanged(version)
+    return rows
+
+
+def count_rows(version=None):
+    """Number of responses in the data file, without importing pandas."""
+    version = version or current_version()
+    published = _published
+    if published and published[0] == version and published[1] is not None:
+        return len(published[1])
+    return _count_rows(version)
+
+
+def build_snapshot():
+    """Write the columnar (Parquet) snapshot used for pushdown reads.
+
+    Snapshots of earlier versions of the file are removed.
+    """
+    import pandas as pd
+
+    version = dataset_version()
+    frame = pd.read_csv(DATA_PATH)
+    _check_unchanged(version)
+
+    path = snapshot_path(version)
+    frame.to_parquet(path, index=False)
+    for stale in DATA_PATH.parent.glob(f"{DATA_PATH.stem}.*.parquet"):
+        if stale != path:
+            stale.unlink()
+    return path
+
+
+if __name__ == "__main__":
+    print(f"Snapshot written to {build_snapshot()}")
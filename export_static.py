@@ -0,0 +1,368 @@
+"""
+Static export of the whole dashboard.
+
+Runs every page script (``app.py`` and everything under ``pages/``) against a
+recording stand-in for ``streamlit`` and writes a self-contained HTML bundle:
+
+- Plotly figures are embedded as JSON and drawn by a bundled ``plotly.min.js``
+- Matplotlib figures are embedded as inline SVG
+- Markdown / text / tables are rendered to plain HTML
+
+Pages are rendered in parallel across a process pool, one page per worker.
+Interactive widgets are frozen at their default values.
+
+Usage:
+    python export_static.py --out site
+    python -m http.server --directory site
+"""
+
+import argparse
+import html
+import io
+import json
+import os
+import runpy
+import sys
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MAIN_SCRIPT = "app.py"
+PAGES_DIR = "pages"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="plotly.min.js"></script>
+<style>
+body {{ font-family: sans-serif; margin: 0; display: flex; }}
+nav {{ width: 220px; min-height: 100vh; padding: 1rem; background: #f0f2f6; }}
+nav a {{ display: block; margin: 0.4rem 0; color: #31333f; }}
+main {{ flex: 1; max-width: 1100px; padding: 1rem 2rem; }}
+.info {{ background: #e8f0fe; padding: 0.75rem; border-radius: 6px; }}
+.error {{ background: #fde8e8; padding: 0.75rem; border-radius: 6px; }}
+.caption {{ color: #6b6f76; font-size: 0.9rem; }}
+.columns {{ display: flex; gap: 1rem; }}
+.columns > div {{ flex: 1; }}
+.metric-value {{ font-size: 2rem; }}
+.table {{ max-height: 400px; overflow: auto; font-size: 0.8rem; }}
+</style>
+</head>
+<body>
+<nav>{nav}</nav>
+<main>
+{body}
+</main>
+</body>
+</html>
+"""
+
+
+# --------------------------------------------------
+# Recording stand-in for the streamlit module
+# --------------------------------------------------
+class StopPage(Exception):
+    """Raised by ``st.stop()`` to end a page early."""
+
+
+def _markdown(text):
+    import markdown
+
+    # Streamlit dedents markdown before rendering; do the same so indented
+    # triple-quoted blocks are not treated as code.
+    return markdown.markdown(
+        textwrap.dedent(text).strip("\n"), extensions=["extra", "sane_lists"]
+    )
+
+
+class _Block:
+    """A container that collects rendered HTML fragments.
+
+    Mirrors the subset of the Streamlit API used by the dashboard pages;
+    anything else is accepted and ignored so new pages still export.
+    """
+
+    def __init__(self):
+        self.parts = []
+        self._figure_count = 0
+
+    # -- containers --------------------------------------------------
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def columns(self, spec, **kwargs):
+        n = spec if isinstance(spec, int) else len(spec)
+        cols = [_Block() for _ in range(n)]
+        self.parts.append(_Columns(cols))
+        return cols
+
+    def tabs(self, labels):
+        blocks = []
+        for label in labels:
+            self.parts.append(f"<h4>{html.escape(label)}</h4>")
+            block = _Block()
+            self.parts.append(block)
+            blocks.append(block)
+        return blocks
+
+    def expander(self, label, *args, **kwargs):
+        self.parts.append(f"<h4>{html.escape(label)}</h4>")
+        block = _Block()
+        self.parts.append(block)
+        return block
+
+    def container(self, *args, **kwargs):
+        block = _Block()
+        self.parts.append(block)
+        return block
+
+    # -- text --------------------------------------------------------
+    def title(self, text, *args, **kwargs):
+        self.parts.append(f"<h1>{html.escape(text)}</h1>")
+
+    def header(self, text, *args, **kwargs):
+        self.parts.append(f"<h2>{html.escape(text)}</h2>")
+
+    def subheader(self, text, *args, **kwargs):
+        self.parts.append(f"<h3>{html.escape(text)}</h3>")
+
+    def markdown(self, text, *args, **kwargs):
+        self.parts.append(_markdown(text))
+
+    def caption(self, text, *args, **kwargs):
+        self.parts.append(f"<div class='caption'>{_markdown(text)}</div>")
+
+    def info(self, text, *args, **kwargs):
+        self.parts.append(f"<div class='info'>{_markdown(text)}</div>")
+
+    def error(self, text, *args, **kwargs):
+        self.parts.append(f"<div class='error'>{_markdown(text)}</div>")
+
+    warning = error
+    success = info
+
+    def write(self, *args, **kwargs):
+        for arg in args:
+            if isinstance(arg, str):
+                self.markdown(arg)
+            elif hasattr(arg, "to_html"):
+                self.dataframe(arg)
+            else:
+                self.parts.append(f"<pre>{html.escape(repr(arg))}</pre>")
+
+    def metric(self, label, value, *args, **kwargs):
+        self.parts.append(
+            f"<div>{html.escape(str(label))}</div>"
+            f"<div class='metric-value'>{html.escape(str(value))}</div>"
+        )
+
+    # -- data --------------------------------------------------------
+    def dataframe(self, data, *args, **kwargs):
+        self.parts.append(
+            f"<div class='table'>{data.to_html(na_rep='', border=0)}</div>"
+        )
+
+    table = dataframe
+
+    # -- figures -----------------------------------------------------
+    def plotly_chart(self, fig, *args, **kwargs):
+        from plotly.utils import PlotlyJSONEncoder
+
+        self._figure_count += 1
+        div_id = f"fig-{id(self)}-{self._figure_count}"
+        spec = json.dumps(fig.to_plotly_json(), cls=PlotlyJSONEncoder)
+        # Survey answers end up in trace labels; keep them from closing the tag
+        spec = spec.replace("</", "<\\/")
+        self.parts.append(
+            f"<div id='{div_id}'></div>"
+            f"<script>(function(){{var f={spec};"
+            f"Plotly.newPlot('{div_id}', f.data, f.layout, "
+            f"{{responsive: true}});}})();</script>"
+        )
+
+    def pyplot(self, fig=None, *args, **kwargs):
+        import matplotlib.pyplot as plt
+
+        fig = fig if fig is not None else plt.gcf()
+        buf = io.StringIO()
+        fig.savefig(buf, format="svg", bbox_inches="tight")
+        plt.close(fig)
+        svg = buf.getvalue()
+        self.parts.append(svg[svg.index("<svg"):])
+
+    # -- widgets (frozen at their defaults) --------------------------
+    def multiselect(self, label, options, default=None, *args, **kwargs):
+        return list(default) if default is not None else []
+
+    def selectbox(self, label, options, index=0, *args, **kwargs):
+        options = list(options)
+        return options[index] if options and index is not None else None
+
+    radio = selectbox
+
+    def slider(self, label, min_value=None, max_value=None, value=None,
+               *args, **kwargs):
+        return value if value is not None else min_value
+
+    def checkbox(self, label, value=False, *args, **kwargs):
+        return value
+
+    toggle = checkbox
+
+    def button(self, *args, **kwargs):
+        return False
+
+    # -- rendering ---------------------------------------------------
+    def __getattr__(self, name):
+        # Unknown elements (st.divider, st.spinner, ...) are no-ops.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: _Block()
+
+    def to_html(self):
+        return "\n".join(
+            part if isinstance(part, str) else part.to_html()
+            for part in self.parts
+        )
+
+
+class _Columns:
+    def __init__(self, cols):
+        self.cols = cols
+
+    def to_html(self):
+        inner = "".join(f"<div>{col.to_html()}</div>" for col in self.cols)
+        return f"<div class='columns'>{inner}</div>"
+
+
+class _StaticStreamlit(_Block):
+    """Module-level ``st`` replacement used while a page script runs."""
+
+    def __init__(self):
+        super().__init__()
+        self.page_title = None
+        self.sidebar = _Block()
+
+    def set_page_config(self, page_title=None, *args, **kwargs):
+        self.page_title = page_title
+
+    def stop(self):
+        raise StopPage
+
+    @staticmethod
+    def _passthrough_cache(func=None, **kwargs):
+        if func is None:
+            return lambda f: f
+        return func
+
+    cache_data = _passthrough_cache
+    cache_resource = _passthrough_cache
+
+
+# --------------------------------------------------
+# Page rendering (runs inside worker processes)
+# --------------------------------------------------
+def page_label(script):
+    """Sidebar label Streamlit would show for a page script."""
+    stem = Path(script).stem
+    return stem.replace("_", " ").strip()
+
+
+def page_filename(script):
+    return "index.html" if script == MAIN_SCRIPT else f"{Path(script).stem}.html"
+
+
+def render_page(script):
+    """Execute one page script and return ``(script, title, body_html)``."""
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    from refresher import NO_BACKGROUND_ENV
+
+    # Pages start the refresher and the in-process API; a worker renders one
+    # page and exits, so neither is wanted (nor a second bind of the API port).
+    os.environ[NO_BACKGROUND_ENV] = "1"
+
+    st = _StaticStreamlit()
+    real_streamlit = sys.modules.get("streamlit")
+    sys.modules["streamlit"] = st
+    try:
+        runpy.run_path(str(ROOT / script), run_name="__main__")
+    except StopPage:
+        pass
+    finally:
+        if real_streamlit is not None:
+            sys.modules["streamlit"] = real_streamlit
+        else:
+            sys.modules.pop("streamlit", None)
+
+    return script, st.page_title or page_label(script), st.to_html()
+
+
+def discover_pages():
+    pages = sorted(
+        str(path.relative_to(ROOT))
+        for path in (ROOT / PAGES_DIR).glob("*.py")
+    )
+    return [MAIN_SCRIPT] + pages
+
+
+# --------------------------------------------------
+# Bundle writer
+# --------------------------------------------------
+def export(out_dir, workers=None):
+    from plotly.offline import get_plotlyjs
+
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "plotly.min.js").write_text(get_plotlyjs(), encoding="utf-8")
+
+    scripts = discover_pages()
+    # One fresh process per page so modules imported by a page never keep a
+    # reference to another page's recorder.
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        rendered = list(pool.map(render_page, scripts))
+
+    nav = "".join(
+        f"<a href='{page_filename(script)}'>"
+        f"{html.escape('Home' if script == MAIN_SCRIPT else page_label(script))}</a>"
+        for script, _, _ in rendered
+    )
+
+    for script, title, body in rendered:
+        page = PAGE_TEMPLATE.format(
+            title=html.escape(title), nav=nav, body=body
+        )
+        (out_dir / page_filename(script)).write_text(page, encoding="utf-8")
+        print(f"  {script} -> {out_dir / page_filename(script)}")
+
+    return out_dir
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Render every dashboard page into a static HTML bundle."
+    )
+    parser.add_argument("--out", default="site", help="output directory")
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="number of worker processes (default: CPU count)"
+    )
+    args = parser.parse_args(argv)
+
+    out_dir = export(args.out, workers=args.workers)
+    print(f"Static dashboard written to {out_dir.resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+Import-time report for the dashboard.
+
+Runs ``python -X importtime`` in fresh interpreters and summarises the
+result:
+
+- the modules the landing page (``app.py``) imports, checked against
+  ``LANDING_BUDGET_MS`` and against ``LANDING_FORBIDDEN`` (the plotting stack
+  and pandas must not be pulled in before a chart page is opened)
+- what is loaded after actually running ``app.py`` once (with ``AppTest``)
+  and letting the background threads it starts settle, checked against
+  ``RUN_FORBIDDEN``; this catches work started by the page, not just its
+  imports
+- the heavy libraries the chart pages load on first use, for reference
+
+Usage:
+    python importtime_report.py
+
+Exits non-zero when the landing page is over budget or imports a forbidden
+module. Timings vary between runs; each measurement is the best of
+``--repeat`` runs.
+"""
+
+import argparse
+import ast
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MAIN_SCRIPT = ROOT / "app.py"
+
+# Cumulative import time allowed for app.py's own imports (streamlit itself
+# is already loaded by the server and is not counted).
+LANDING_BUDGET_MS = 150
+
+LANDING_FORBIDDEN = ("pandas", "plotly", "matplotlib", "seaborn")
+
+# Must still be absent after a landing-page run has settled (plotly is
+# imported by streamlit's own runtime, so it is compared against a bare run)
+RUN_FORBIDDEN = ("pandas", "numpy", "scipy", "plotly", "matplotlib", "seaborn")
+
+# Seconds to wait after the run; the refresher polls every RUN_POLL_INTERVAL
+RUN_SETTLE_S = 2.0
+RUN_POLL_INTERVAL = "0.5"
+
+HEAVY_MODULES = ("pandas", "plotly.express", "matplotlib.pyplot", "seaborn")
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def landing_imports():
+    """Top-level modules imported by ``app.py``, other than streamlit."""
+    tree = ast.parse(MAIN_SCRIPT.read_text(encoding="utf-8"))
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return [m for m in dict.fromkeys(modules) if m.split(".")[0] != "streamlit"]
+
+
+def measure(modules, preload=()):
+    """``(total_ms, imported_names)`` for importing ``modules``.
+
+    ``preload`` modules are imported first and excluded from the total.
+    """
+    code = "".join(f"import {m}\n" for m in preload)
+    code += "import sys; sys.stderr.write('--start--\\n')\n"
+    code += "".join(f"import {m}\n" for m in modules)
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    stderr = result.stderr.split("--start--\n", 1)[-1]
+    total_us = 0
+    names = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        names.append(name)
+        # Entries with a single leading space are top-level imports; their
+        # cumulative time already includes everything beneath them.
+        if len(indent) == 1:
+            total_us += int(cumulative)
+    return total_us / 1000, names
+
+
+def modules_after_run(app_test):
+    """Names in ``sys.modules`` after running ``app_test`` and settling.
+
+    ``app_test`` is the ``AppTest`` constructor call, e.g.
+    ``AppTest.from_file('app.py')``; it runs in a fresh interpreter.
+    """
+    code = (
+        "import sys, time\n"
+        f"sys.path.insert(0, {str(ROOT)!r})\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = {app_test}.run()\n"
+        "if at.exception:\n"
+        "    sys.exit(at.exception[0].value)\n"
+        f"time.sleep({RUN_SETTLE_S})\n"
+        "print('\\n'.join(sys.modules))\n"
+    )
+    env = dict(os.environ, DASHBOARD_REFRESH_INTERVAL=RUN_POLL_INTERVAL)
+    # Don't bind the API port from the report
+    env.pop("DASHBOARD_API_PORT", None)
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return set(result.stdout.split())
+
+
+def best_of(repeat, modules, preload=()):
+    runs = [measure(modules, preload) for _ in range(repeat)]
+    return min(runs, key=lambda run: run[0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report and check import times.")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measurement (best is reported)")
+    args = parser.parse_args(argv)
+
+    failed = False
+
+    modules = landing_imports()
+    landing_ms, names = best_of(args.repeat, modules, preload=("streamlit",))
+    forbidden = sorted({
+        name for name in names if name.split(".")[0] in LANDING_FORBIDDEN
+    })
+
+    print(f"Landing page imports ({', '.join(modules)}):")
+    status = "ok" if landing_ms <= LANDING_BUDGET_MS else "OVER BUDGET"
+    print(f"  {landing_ms:8.1f} ms  (budget {LANDING_BUDGET_MS} ms)  {status}")
+    if landing_ms > LANDING_BUDGET_MS:
+        failed = True
+    if forbidden:
+        failed = True
+        top = sorted({name.split(".")[0] for name in forbidden})
+        print(f"  imports forbidden module(s): {', '.join(top)}")
+
+    baseline = modules_after_run('AppTest.from_string("import streamlit")')
+    loaded = modules_after_run(f"AppTest.from_file({str(MAIN_SCRIPT)!r})") - baseline
+    loaded_forbidden = sorted({
+        name.split(".")[0] for name in loaded if name.split(".")[0] in RUN_FORBIDDEN
+    })
+    print(f"\nAfter running app.py and waiting {RUN_SETTLE_S:.0f}s:")
+    if loaded_forbidden:
+        failed = True
+        print(f"  loaded forbidden module(s): {', '.join(loaded_forbidden)}")
+    else:
+        print(f"  none of {', '.join(RUN_FORBIDDEN)} loaded  ok")
+
+    print("\nHeavy libraries (loaded on first use by chart pages):")
+    for module in HEAVY_MODULES:
+        try:
+            ms, _ = best_of(args.repeat, [module])
+        except RuntimeError as exc:
+            print(f"  {module:<20} not importable ({exc})")
+            continue
+        print(f"  {module:<20} {ms:8.1f} ms")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Load test for the dashboard.
+
+Simulates concurrent sessions with Streamlit's ``AppTest`` harness: each
+session is a thread that keeps navigating between ``app.py`` and the pages,
+toggling the overview filters on the way. Sessions are spread over several
+worker processes, each of which samples its own resident memory (and the
+number of open Matplotlib figures) while it runs.
+
+Reported at the end:
+- rerun latency p50 / p95 / p99, overall and per page
+- throughput (reruns per second)
+- RSS growth and open figures per process over time
+
+Memory growth is measured from a baseline taken once every session in a
+process has run each script once, so the imports and cache warm-up of the
+first pass are not counted as growth.
+
+Usage:
+    python loadtest.py --sessions 100 --processes 4 --duration 60
+
+Exits non-zero when a run had errors or a process grew by more than
+``--max-rss-growth`` MiB, so it can gate deployments and catch leaks such as
+figures that are never closed.
+"""
+
+import argparse
+import math
+import os
+import random
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+MAIN_SCRIPT = "app.py"
+OVERVIEW_PAGE = "pages/overview_dataset.py"
+
+
+def discover_scripts():
+    pages = sorted(str(p.relative_to(ROOT)) for p in (ROOT / "pages").glob("*.py"))
+    return [MAIN_SCRIPT] + pages
+
+
+# --------------------------------------------------
+# Measurements
+# --------------------------------------------------
+def current_rss():
+    """Resident set size of this process in bytes."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Not Linux: fall back to the peak RSS (KiB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def open_figures():
+    """Number of Matplotlib figures still open in this process."""
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    # A session thread may still be importing pyplot when we sample
+    get_fignums = getattr(pyplot, "get_fignums", None)
+    return len(get_fignums()) if get_fignums else 0
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return float("nan")
+    rank = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+# --------------------------------------------------
+# Worker process
+# --------------------------------------------------
+def _toggle_filters(at, rng, record):
+    """Change the overview multiselects and time each rerun."""
+    for widget in at.multiselect:
+        options = list(widget.options)
+        if not options:
+            continue
+        chosen = rng.sample(options, rng.randint(1, len(options)))
+        start = time.perf_counter()
+        widget.set_value(chosen).run()
+        record(OVERVIEW_PAGE, "filter", time.perf_counter() - start, at)
+
+
+def _session(session_id, scripts, deadline, timeout, results, lock, warmed):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(session_id)
+    # Warm-up: visit every script once (in random order) before wandering
+    first_pass = rng.sample(scripts, len(scripts))
+
+    def record(script, action, elapsed, at):
+        failed = bool(at.exception)
+        with lock:
+            results["latencies"].append((script, action, elapsed))
+            if failed:
+                results["errors"].append(f"{script}: {at.exception[0].value}")
+
+    while time.monotonic() < deadline:
+        script = first_pass.pop() if first_pass else rng.choice(scripts)
+        try:
+            at = AppTest.from_file(str(ROOT / script), default_timeout=timeout)
+            start = time.perf_counter()
+            at.run()
+            record(script, "load", time.perf_counter() - start, at)
+
+            if script == OVERVIEW_PAGE and not at.exception:
+                _toggle_filters(at, rng, record)
+        except Exception as exc:
+            with lock:
+                results["errors"].append(f"{script}: {exc!r}")
+        if first_pass == [] and warmed is not None:
+            warmed()
+            warmed = None
+
+
+def run_worker(worker_id, sessions, duration, timeout, sample_interval):
+    """Run ``sessions`` concurrent sessions in this process for ``duration`` s."""
+    os.chdir(ROOT)
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+    scripts = discover_scripts()
+    results = {"latencies": [], "errors": [], "samples": [], "baseline": None}
+    lock = threading.Lock()
+    started = time.monotonic()
+    deadline = started + duration
+
+    warm_sessions = [0]
+    all_warm = threading.Event()
+
+    def warmed():
+        with lock:
+            warm_sessions[0] += 1
+            if warm_sessions[0] == sessions:
+                all_warm.set()
+
+    threads = [
+        threading.Thread(
+            target=_session,
+            args=(worker_id * 10_000 + i, scripts, deadline, timeout, results,
+                  lock, warmed),
+            daemon=True,
+        )
+        for i in range(sessions)
+    ]
+    for thread in threads:
+        thread.start()
+
+    def sample():
+        results["samples"].append(
+            (time.monotonic() - started, current_rss(), open_figures())
+        )
+        if results["baseline"] is None and all_warm.is_set():
+            results["baseline"] = results["samples"][-1]
+
+    while any(thread.is_alive() for thread in threads):
+        sample()
+        time.sleep(sample_interval)
+    sample()
+
+    results["worker"] = worker_id
+    results["pid"] = os.getpid()
+    return results
+
+
+# --------------------------------------------------
+# Report
+# --------------------------------------------------
+def _latency_row(label, values):
+    values = sorted(values)
+    return (
+        f"  {label:<34} n={len(values):>6}  "
+        f"p50={percentile(values, 50) * 1000:8.1f}ms  "
+        f"p95={percentile(values, 95) * 1000:8.1f}ms  "
+        f"p99={percentile(values, 99) * 1000:8.1f}ms"
+    )
+
+
+def report(worker_results, wall_time, max_rss_growth):
+    latencies = [entry for r in worker_results for entry in r["latencies"]]
+    errors = [error for r in worker_results for error in r["errors"]]
+
+    print("\nRerun latency")
+    print(_latency_row("all", [elapsed for _, _, elapsed in latencies]))
+    for script in discover_scripts():
+        for action in ("load", "filter"):
+            values = [e for s, a, e in latencies if s == script and a == action]
+            if values:
+                print(_latency_row(f"{script} [{action}]", values))
+
+    print(f"\nThroughput: {len(latencies) / wall_time:.1f} reruns/s "
+          f"({len(latencies)} reruns in {wall_time:.1f}s)")
+
+    print("\nMemory per process")
+    over_budget = False
+    for result in worker_results:
+        samples = result["samples"]
+        baseline = result["baseline"]
+        if baseline is None:
+            # Too short for every session to finish its first pass
+            baseline, since = samples[0], "start, warm-up not finished"
+        else:
+            since = f"warm-up done at {baseline[0]:.0f}s"
+        base_rss, last_rss = baseline[1], samples[-1][1]
+        growth = (last_rss - base_rss) / 2**20
+        over_budget |= max_rss_growth is not None and growth > max_rss_growth
+        print(f"  worker {result['worker']} (pid {result['pid']}): "
+              f"{base_rss / 2**20:.0f} -> {last_rss / 2**20:.0f} MiB "
+              f"({growth:+.0f} MiB since {since}), "
+              f"open figures at end: {samples[-1][2]}")
+        step = max(1, len(samples) // 10)
+        timeline = ", ".join(
+            f"{t:.0f}s:{rss / 2**20:.0f}MiB/{figs}fig"
+            for t, rss, figs in samples[::step]
+        )
+        print(f"    {timeline}")
+
+    if errors:
+        print(f"\n{len(errors)} error(s); first few:")
+        for error in errors[:5]:
+            print(f"  {error}")
+    if over_budget:
+        print(f"\nRSS growth exceeded {max_rss_growth} MiB in at least one process")
+
+    return 1 if errors or over_budget else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Simulate concurrent dashboard sessions and report latency and memory."
+    )
+    parser.add_argument("--sessions", type=int, default=20,
+                        help="total concurrent sessions")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="worker processes to spread sessions over")
+    parser.add_argument("--duration", type=float, default=30,
+                        help="seconds to run")
+    parser.add_argument("--timeout", type=float, default=30,
+                        help="per-rerun timeout in seconds")
+    parser.add_argument("--sample-interval", type=float, default=1.0,
+                        help="seconds between memory samples")
+    parser.add_argument("--max-rss-growth", type=float, default=None,
+                        help="fail if any process grows by more than this many MiB "
+                             "after warm-up")
+    args = parser.parse_args(argv)
+
+    per_process = [
+        args.sessions // args.processes + (i < args.sessions % args.processes)
+        for i in range(args.processes)
+    ]
+    print(f"Running {args.sessions} sessions in {args.processes} process(es) "
+          f"for {args.duration:.0f}s ...")
+
+    started = time.monotonic()
+    with ProcessPoolExecutor(max_workers=args.processes) as pool:
+        futures = [
+            pool.submit(run_worker, i, n, args.duration, args.timeout,
+                        args.sample_interval)
+            for i, n in enumerate(per_process) if n
+        ]
+        worker_results = [future.result() for future in futures]
+    wall_time = time.monotonic() - started
+
+    sys.exit(report(worker_results, wall_time, args.max_rss_growth))
+
+
+if __name__ == "__main__":
+    main()
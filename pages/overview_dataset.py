@@ -1,6 +1,7 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from charts import overview_data, overview_defaults, render_chart
+from data_loader import current_version, load_data
 
 st.set_page_config(
     page_title="Dataset Overview",
@@ -19,11 +20,11 @@ st.markdown("---")
 # --------------------------------------------------
 # Load dataset
 # --------------------------------------------------
-@st.cache_data
-def load_data():
-    return pd.read_csv("cleaned_student_study_dataset_FINAL.csv")
+# One dataset version for the whole rerun, even if a new one is published
+# while it runs
+version = current_version()
 
-df = load_data()
+df = load_data(version=version)
 
 # --------------------------------------------------
 # Dataset preview (interactive table)
@@ -43,112 +44,36 @@ st.markdown("---")
 # --------------------------------------------------
 st.subheader("🔎 Filter Responses")
 
+gender_options, level_options = overview_defaults(df)
+
 col1, col2 = st.columns(2)
 
 with col1:
     selected_gender = st.multiselect(
         "Select Gender:",
-        options=df["Gender"].unique(),
-        default=df["Gender"].unique()
+        options=gender_options,
+        default=gender_options
     )
 
 with col2:
     selected_level = st.multiselect(
         "Select Level of Study:",
-        options=df["Level of Study"].unique(),
-        default=df["Level of Study"].unique()
+        options=level_options,
+        default=level_options
     )
 
-filtered_df = df[
-    (df["Gender"].isin(selected_gender)) &
-    (df["Level of Study"].isin(selected_level))
-]
+filtered_df, filter_scope = overview_data([selected_gender, selected_level], version)
 
 st.caption(f"Filtered dataset size: **{len(filtered_df)} respondents**")
 
 st.markdown("---")
 
 # ==================================================
-# 1. Gender Distribution
-# ==================================================
-st.subheader("1️⃣ Gender Distribution")
-
-gender_counts = filtered_df["Gender"].value_counts().reset_index()
-gender_counts.columns = ["Gender", "Number of Students"]
-
-fig1 = px.bar(
-    gender_counts,
-    x="Gender",
-    y="Number of Students",
-    text_auto=True,
-    title="Gender Distribution of Respondents"
-)
-
-st.plotly_chart(fig1, use_container_width=True)
-
-st.caption(
-    "This chart shows the distribution of respondents by gender."
-)
-
-st.markdown("---")
-
-# ==================================================
-# 2. Level of Study
-# ==================================================
-st.subheader("2️⃣ Level of Study")
-
-level_counts = filtered_df["Level of Study"].value_counts().reset_index()
-level_counts.columns = ["Level of Study", "Number of Students"]
-
-fig2 = px.bar(
-    level_counts,
-    x="Level of Study",
-    y="Number of Students",
-    text_auto=True,
-    title="Distribution of Students by Level of Study"
-)
-
-st.plotly_chart(fig2, use_container_width=True)
-
-st.caption(
-    "This chart presents the distribution of students by their level of study."
-)
-
-st.markdown("---")
-
-# ==================================================
-# 3. Study Hours per Week
+# Charts (see charts.py for the chart definitions)
 # ==================================================
-st.subheader("3️⃣ Study Hours per Week (Outside Class)")
-
-study_hours_counts = (
-    filtered_df["On average, how many hours per week do you study outside of class?"]
-    .value_counts()
-    .reset_index()
-)
-
-study_hours_counts.columns = ["Study Hours", "Number of Students"]
-
-fig3 = px.bar(
-    study_hours_counts,
-    x="Study Hours",
-    y="Number of Students",
-    text_auto=True,
-    title="Weekly Study Hours Outside of Class"
-)
-
-fig3.update_layout(
-    xaxis_title="Study Hours Category",
-    yaxis_title="Number of Students"
-)
-
-st.plotly_chart(fig3, use_container_width=True)
-
-st.caption(
-    "This chart illustrates how much time students spend studying outside of class."
-)
-
-st.markdown("---")
+for key in ["overview.gender", "overview.level", "overview.study_hours"]:
+    render_chart(key, df=filtered_df, scope=filter_scope, version=version)
+    st.markdown("---")
 
 # --------------------------------------------------
 # Summary
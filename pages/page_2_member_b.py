@@ -1,8 +1,10 @@
 import streamlit as st
-import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
-import os
+
+import analytics
+from data_loader import DATA_PATH, current_version, load_data
+from schema import SchemaError
 
 # -----------------------------
 # Page Title
@@ -18,34 +20,32 @@ Objective: To analyze the average levels of stress, distraction, and motivation
 # -----------------------------
 # Load Dataset
 # -----------------------------
-DATA_FILE = "cleaned_student_study_dataset_FINAL.csv"
-
-if not os.path.exists(DATA_FILE):
-    st.error("CSV not found! Make sure cleaned_student_study_dataset_FINAL.csv is in the repo root.")
+if not DATA_PATH.exists():
+    st.error(f"CSV not found! Make sure {DATA_PATH.name} is in the repo root.")
     st.stop()
 
-df = pd.read_csv(DATA_FILE)
+# Every chart below reads this dataset version
+version = current_version()
 
-# -----------------------------
-# Rename Columns (same as Colab)
-# -----------------------------
-df = df.rename(columns={
-    'How often do you experience the following challenges?   [Lack of time]': 'Stress',
-    'How often do you experience the following challenges?   [Distractions (phone/social media)]': 'Distraction',
-    'How motivated are you to study this semester?': 'Motivation'
-})
+# Columns are requested under their display aliases (see schema.py),
+# so no renaming is needed here.
+try:
+    df = load_data(columns=['Distraction', 'Motivation'], version=version)
+except SchemaError as exc:
+    st.error(f"The dataset does not match the expected layout.\n\n{exc}")
+    st.stop()
 
 # -----------------------------
 # SECTION 1: Bar Chart
 # -----------------------------
 st.subheader("1. Bar Chart of Average Stress, Distraction and Motivation Challenges")
 
-avg_challenges = df[['obs_time', 'obs_distraction', 'obs_motivation']].mean()
+avg_challenges = analytics.aggregate("challenge_means", version)
 
 fig, ax = plt.subplots(figsize=(8, 5))
 ax.bar(
     ['Stress', 'Distraction', 'Lack of Motivation'],
-    avg_challenges.values
+    avg_challenges["Average Level"].values
 )
 
 ax.set_title("Average Stress, Distraction and Motivation Challenges")
@@ -65,15 +65,9 @@ The bar chart titled average Stress, distraction and lack of motivation shows th
 # -----------------------------
 st.subheader("2. Heatmap of Correlation Between Stress, Distraction and Motivation")
 
-df_for_heatmap = df[['obs_time', 'obs_distraction', 'Motivation']].copy()
-df_for_heatmap = df_for_heatmap.rename(columns={
-    'obs_time': 'Stress',
-    'obs_distraction': 'Distraction'
-})
-
 fig, ax = plt.subplots(figsize=(8, 6))
 sns.heatmap(
-    df_for_heatmap.corr(),
+    analytics.aggregate("challenge_correlation", version),
     annot=True,
     cmap="coolwarm",
     ax=ax
@@ -94,11 +88,14 @@ The heatmap shows the correlation between stress, distraction, and motivation. I
 st.subheader("3. Bar Chart of Motivation Level Frequency")
 
 # Count frequency of motivation levels
-motivation_counts = df["Motivation"].value_counts().sort_index()
+motivation_counts = analytics.aggregate("motivation_counts", version)
 
 # Create the bar chart (default color)
 fig, ax = plt.subplots(figsize=(8,5))
-ax.bar(motivation_counts.index, motivation_counts.values)  # default blue
+ax.bar(
+    motivation_counts["Motivation Level"],
+    motivation_counts["Number of Students"]
+)  # default blue
 ax.set_xlabel("Motivation Level")
 ax.set_ylabel("Number of Students")
 ax.set_title("Motivation Level Frequency")
@@ -121,7 +118,7 @@ st.subheader("4. Box plot of Motivation Across Different Distraction Levels")
 fig, ax = plt.subplots(figsize=(8, 5))
 sns.boxplot(
     data=df,
-    x='obs_distraction',
+    x='Distraction',
     y='Motivation',
     ax=ax
 )
@@ -143,12 +140,12 @@ This box plot represents the relationship between student motivation and the lev
 # -----------------------------
 st.subheader("5. Line Chart of Stress Level Across Different Distraction Levels")
 
-stress_motivation = df.groupby('obs_time')['obs_motivation'].mean()
+stress_motivation = analytics.aggregate("motivation_by_stress", version)
 
 fig, ax = plt.subplots(figsize=(8, 5))
 ax.plot(
-    stress_motivation.index,
-    stress_motivation.values,
+    stress_motivation["obs_time"],
+    stress_motivation["obs_motivation"],
     marker='o'
 )
 
@@ -0,0 +1,116 @@
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from segmentation import segment_model
+
+# --------------------------------------------------
+# Page configuration
+# --------------------------------------------------
+st.set_page_config(
+    page_title="Student Segments",
+    layout="wide"
+)
+
+# --------------------------------------------------
+# Title & Objective
+# --------------------------------------------------
+st.title("Student Segments: Study & Challenge Profiles")
+
+st.markdown("""
+### Objective
+To group students with similar study-technique usage, perceived effectiveness, learning challenges
+and outcomes, and compare the typical profile of each group.
+""")
+
+st.markdown("---")
+
+# --------------------------------------------------
+# Segmentation settings
+# --------------------------------------------------
+k = st.slider("Number of segments:", min_value=2, max_value=6, value=3)
+
+model = segment_model(k)
+
+def _shares(features):
+    return ", ".join(f"`{name}` ({share:.0%} missing)" for name, share in features.items())
+
+
+caption = (
+    "Students are clustered with mini-batch k-means on their standardised Likert answers; "
+    "missing answers are filled with the median response."
+)
+if model.dropped:
+    caption += f" Left out for too many missing answers: {_shares(model.dropped)}."
+if model.imputed:
+    caption += f" Median-imputed: {_shares(model.imputed)}."
+
+st.caption(caption)
+
+st.markdown("---")
+
+# ==================================================
+# 1. Segment Sizes
+# ==================================================
+st.subheader("1️⃣ Segment Sizes")
+
+sizes = model.sizes.reset_index()
+
+fig1 = px.bar(
+    sizes,
+    x="Segment",
+    y="Students",
+    text_auto=True,
+    title="Number of Students in Each Segment"
+)
+
+st.plotly_chart(fig1, use_container_width=True)
+
+st.caption(
+    "Segments are numbered from largest to smallest."
+)
+
+st.markdown("---")
+
+# ==================================================
+# 2. Segment Profiles (Radar Chart)
+# ==================================================
+st.subheader("2️⃣ Segment Profiles")
+
+fig2 = go.Figure()
+
+for segment, row in model.profile.iterrows():
+    fig2.add_trace(go.Scatterpolar(
+        r=list(row.values) + [row.values[0]],
+        theta=list(row.index) + [row.index[0]],
+        name=segment
+    ))
+
+fig2.update_layout(
+    polar=dict(radialaxis=dict(range=[1, 5])),
+    title="Average Answers per Segment (1–5)",
+    height=650
+)
+
+st.plotly_chart(fig2, use_container_width=True)
+
+st.caption(
+    "Each line shows the average answer of one segment for every study technique, "
+    "challenge and outcome measure."
+)
+
+st.markdown("---")
+
+# ==================================================
+# 3. Segment Profile Table
+# ==================================================
+st.subheader("3️⃣ Segment Profile Table")
+
+st.dataframe(model.profile.T.round(2), use_container_width=True)
+
+st.markdown("""
+**How to read this page:**
+* Segments with higher `obs_*` values report more frequent learning challenges.
+* Comparing `freq_*` and `eff_*` values shows whether a group's habits match what it finds effective.
+* The derived indices (`obstacles_index`, `support_index`, `learning_effectiveness`) summarise each group's overall situation.
+""")
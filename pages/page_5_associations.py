@@ -0,0 +1,121 @@
+import streamlit as st
+import plotly.express as px
+
+from associations import CATEGORICAL, associations
+
+# --------------------------------------------------
+# Page configuration
+# --------------------------------------------------
+st.set_page_config(
+    page_title="Associations Between Survey Answers",
+    layout="wide"
+)
+
+# --------------------------------------------------
+# Title & Objective
+# --------------------------------------------------
+st.title("Associations Between Categorical Survey Answers")
+
+st.markdown("""
+### Objective
+To measure how strongly students' categorical answers (demographics, study habits and sleep)
+are related to each other, and to explore the cross-tabulation behind each relationship.
+""")
+
+LABELS = {
+    "Gender": "Gender",
+    "Age": "Age",
+    "Level of Study": "Level of Study",
+    "study_hours": "Study Hours",
+    "part_time_work": "Part-time Work",
+    "study_environment": "Study Environment",
+    "goal_setting": "Goal Setting",
+    "study_preference": "Study Preference",
+    "study_time": "Study Time",
+    "sleep_hours": "Sleep Hours",
+}
+
+result = associations()
+
+st.markdown("---")
+
+# ==================================================
+# 1. Association Heatmap (Cramér's V)
+# ==================================================
+st.subheader("1️⃣ Association Heatmap (Cramér's V)")
+
+labels = [LABELS[c] for c in CATEGORICAL]
+
+fig1 = px.imshow(
+    result.cramers_v.set_axis(labels, axis=0).set_axis(labels, axis=1),
+    text_auto=".2f",
+    zmin=0,
+    zmax=1,
+    color_continuous_scale="Blues",
+    title="Cramér's V Between Categorical Answers"
+)
+
+fig1.update_layout(height=650)
+
+st.plotly_chart(fig1, use_container_width=True)
+
+st.caption(
+    "Cramér's V ranges from 0 (no association) to 1 (perfect association). "
+    "It is based on the chi-square test of independence for each pair of answers."
+)
+
+st.markdown("---")
+
+# ==================================================
+# 2. Drill-down: Cross-tabulation
+# ==================================================
+st.subheader("2️⃣ Explore a Pair of Answers")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    row_var = st.selectbox(
+        "Rows:",
+        options=CATEGORICAL,
+        format_func=LABELS.get,
+        index=CATEGORICAL.index("study_time")
+    )
+
+with col2:
+    col_var = st.selectbox(
+        "Columns:",
+        options=[c for c in CATEGORICAL if c != row_var],
+        format_func=LABELS.get
+    )
+
+m1, m2 = st.columns(2)
+m1.metric("Cramér's V", f"{result.cramers_v.loc[row_var, col_var]:.2f}")
+m2.metric("Chi-square p-value", f"{result.p_values.loc[row_var, col_var]:.3f}")
+
+crosstab = result.crosstab(row_var, col_var)
+
+st.dataframe(crosstab, use_container_width=True)
+
+stacked = crosstab.reset_index().melt(
+    id_vars=row_var,
+    var_name=col_var,
+    value_name="Number of Students"
+)
+
+fig2 = px.bar(
+    stacked,
+    x=row_var,
+    y="Number of Students",
+    color=col_var,
+    text_auto=True,
+    labels={row_var: LABELS[row_var], col_var: LABELS[col_var]},
+    title=f"{LABELS[row_var]} by {LABELS[col_var]}"
+)
+
+st.plotly_chart(fig2, use_container_width=True)
+
+st.caption(
+    "A p-value below 0.05 suggests the two answers are not independent. "
+    "With about 100 respondents, small cells make the test less reliable, "
+    "so read weak associations with caution."
+)
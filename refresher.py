@@ -0,0 +1,136 @@
+"""
+Background refresh of the dataset and derived caches.
+
+A daemon thread polls the data file. Its first pass only records the
+version on disk, so starting the refresher (e.g. from the landing page) loads
+nothing; that version's caches fill on demand as pages are opened. When the
+version later changes, the thread loads the new dataset and warms the caches
+behind every chart for that version: the named aggregates, the chart registry
+aggregates (the overview's for its default filter selection), the default
+segmentation and the categorical association matrix. Only then does it
+publish the new version through ``data_loader.publish``.
+
+Until publication, sessions keep reading the previous version, which stays
+fully cached, so replacing the file never puts a cold load on a user's
+rerun. If the new file fails to load (e.g. a ``SchemaError``), the error is
+logged and the previous version stays live.
+
+``data_loader.current_version()`` starts it on first use, so every process
+that reads the dataset (the Streamlit server, the API) runs one. Repeated
+``start()`` calls are no-ops, as are calls in processes with
+``DASHBOARD_NO_BACKGROUND`` set (e.g. static export workers, which render each
+page once and exit).
+"""
+
+import logging
+import os
+import threading
+
+import data_loader
+
+POLL_INTERVAL_ENV = "DASHBOARD_REFRESH_INTERVAL"
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Set in processes that must not start background threads (refresher, API)
+NO_BACKGROUND_ENV = "DASHBOARD_NO_BACKGROUND"
+
+logger = logging.getLogger(__name__)
+
+_thread = None
+_start_lock = threading.Lock()
+_stop = threading.Event()
+
+
+def warm(version):
+    """Load ``version`` and compute everything the pages read from it.
+
+    Returns the full frame for ``data_loader.publish``.
+    """
+    import analytics
+    import associations
+    import charts
+    import segmentation
+
+    frame = data_loader.load_data(version=version)
+
+    aggregates = list(analytics.AGGREGATES.values())
+    aggregates += [spec.aggregate for spec in charts.CHARTS.values()]
+    analytics.compute(aggregates, version=version)
+
+    # The overview page reads its charts under the scope of its filters
+    overview, scope = charts.overview_data(charts.overview_defaults(frame), version)
+    analytics.compute(
+        [spec.aggregate for spec in charts.page_charts("overview")],
+        df=overview, scope=scope, version=version,
+    )
+
+    segmentation.segment_model(version=version)
+    associations.associations(version=version)
+    return frame
+
+
+def refresh_once():
+    """Publish the file's current version if it is new. Returns True if so."""
+    version = data_loader.dataset_version()
+    published = data_loader.published_version()
+    if version == published:
+        return False
+
+    if published is None:
+        # First pass: record the version sessions are already reading
+        data_loader.publish(version)
+        logger.info("Serving dataset version %s", version)
+        return True
+
+    frame = warm(version)
+
+    # The file may have been replaced again while warming; publish only if
+    # what was warmed is still what is on disk.
+    if data_loader.dataset_version() != version:
+        return False
+
+    data_loader.publish(version, frame)
+    logger.info("Published dataset version %s", version)
+    return True
+
+
+def _run(interval):
+    failed_version = None
+    while not _stop.is_set():
+        version = None
+        try:
+            version = data_loader.dataset_version()
+            if version != failed_version:
+                refresh_once()
+        except Exception:
+            failed_version = version
+            logger.exception(
+                "Could not load dataset version %s; still serving %s",
+                version, data_loader.current_version(),
+            )
+        _stop.wait(interval)
+
+
+def start(interval=None):
+    """Start the refresher thread for this process (idempotent)."""
+    global _thread
+    if os.environ.get(NO_BACKGROUND_ENV):
+        return None
+    with _start_lock:
+        if _thread is not None and _thread.is_alive():
+            return _thread
+
+        if interval is None:
+            interval = float(os.environ.get(POLL_INTERVAL_ENV, DEFAULT_POLL_INTERVAL))
+
+        _stop.clear()
+        _thread = threading.Thread(
+            target=_run, args=(interval,), name="dataset-refresher", daemon=True
+        )
+        _thread.start()
+        return _thread
+
+
+def stop():
+    """Stop the refresher thread (used by tests and tooling)."""
+    _stop.set()
@@ -0,0 +1,223 @@
+"""
+Schema of the cleaned survey dataset.
+
+One ``Column`` per field: its canonical name, the header it has in the data
+file, any aliases pages use for it, and its expected type and values.
+
+``data_loader`` resolves every requested name (canonical, alias or raw file
+header) through ``resolve`` and validates each frame once when it is loaded,
+so pages never rename or copy columns themselves and schema drift is
+reported up front instead of breaking individual charts.
+"""
+
+from dataclasses import dataclass
+
+LIKERT = (1, 5)
+
+LIKERT_TEXT = ("never", "rarely", "sometimes", "often", "very often")
+
+
+class SchemaError(ValueError):
+    """The dataset does not match the expected schema."""
+
+
+@dataclass(frozen=True)
+class Column:
+    """One dataset field.
+
+    ``kind`` is ``"numeric"`` (checked against ``value_range``),
+    ``"category"`` (checked against ``values``) or ``"text"`` (unchecked).
+    ``source`` defaults to ``name`` when the file header is already short.
+    """
+
+    name: str
+    kind: str
+    source: str = None
+    aliases: tuple = ()
+    values: tuple = None
+    value_range: tuple = None
+
+    @property
+    def header(self):
+        return self.source or self.name
+
+
+def _likert(name, *aliases, source=None):
+    return Column(name, "numeric", source=source, aliases=aliases, value_range=LIKERT)
+
+
+def _challenge_header(challenge):
+    return f"How often do you experience the following challenges?   [{challenge}]"
+
+
+COLUMNS = [
+    # Part A: demographics
+    Column("Gender", "category", aliases=("gender",), values=("female", "male")),
+    Column("Age", "category", aliases=("age",), values=(
+        "19 - 20 years", "21 - 22 years", "23 - 25 years", "> 25 years",
+    )),
+    Column("Level of Study", "category", aliases=("level_of_study",), values=(
+        "diploma", "foundation", "postgraduate", "undergraduate",
+    )),
+    Column("Programme / Major", "text", aliases=("programme",)),
+    Column(
+        "study_hours", "category",
+        source="On average, how many hours per week do you study outside of class?",
+        aliases=("Study Hours",),
+        values=(
+            "less than 3 hours", "3–5 hours", "6–10 hours",
+            "11–15 hours", "more than 15 hours",
+        ),
+    ),
+    Column(
+        "part_time_work", "category",
+        source="Are you currently working part-time?",
+        values=("no", "yes"),
+    ),
+    Column(
+        "study_environment", "category",
+        source="What is your preferred study environment?",
+        values=(
+            "café / public spaces", "no preference", "online / virtual study room",
+            "quiet spaces (library, room)", "study room with background noise",
+        ),
+    ),
+    # Part B: study techniques
+    _likert("freq_reading"),
+    _likert("freq_videos"),
+    _likert("freq_practice"),
+    _likert("freq_group"),
+    _likert("freq_summary"),
+    _likert("freq_flashcards"),
+    _likert("freq_teaching"),
+    _likert("eff_reading"),
+    _likert("eff_practice"),
+    _likert("eff_group"),
+    _likert("eff_flashcards"),
+    _likert("eff_videos"),
+    Column("goal_setting", "category", values=(
+        "never", "rarely", "sometimes", "often", "always",
+    )),
+    _likert("distraction_control"),
+    Column("study_preference", "category", values=(
+        "alone", "i switch between both depending on the subject", "with peers/group",
+    )),
+    Column("study_time", "category", values=(
+        "afternoon", "early morning", "evening", "late night", "no fixed time",
+    )),
+    # Part C: challenges and support
+    _likert("obs_time", "Stress", _challenge_header("Lack of time")),
+    _likert("obs_workload"),
+    _likert(
+        "obs_distraction", "Distraction",
+        _challenge_header("Distractions (phone/social media)"),
+    ),
+    _likert("obs_environment"),
+    _likert("obs_motivation", "Lack of Motivation"),
+    Column(
+        "obs_understanding", "category",
+        source=_challenge_header("Difficulty understanding the subject"),
+        values=LIKERT_TEXT,
+    ),
+    _likert("obs_health"),
+    Column(
+        "obs_internet", "category",
+        source=_challenge_header("Internet or device problems"),
+        values=LIKERT_TEXT,
+    ),
+    Column("sleep_hours", "category", values=(
+        "less than 4 hours", "4–5 hours", "6–7 hours", "8–9 hours", "more than 9 hours",
+    )),
+    _likert(
+        "motivation", "Motivation",
+        source="How motivated are you to study this semester?",
+    ),
+    Column("support_needed", "text"),
+    Column(
+        "comments", "text",
+        source="Any extra comments about your study habits?",
+    ),
+    # Derived indices
+    _likert("sleep_quality"),
+    _likert("obstacles_index"),
+    _likert("support_index"),
+    _likert("learning_effectiveness"),
+]
+
+_BY_NAME = {}
+for _column in COLUMNS:
+    for _name in (_column.name, _column.header, *_column.aliases):
+        _BY_NAME[_name] = _column
+del _column, _name
+
+
+def resolve(name):
+    """``Column`` for a canonical name, alias or raw file header."""
+    try:
+        return _BY_NAME[name]
+    except KeyError:
+        raise SchemaError(f"Unknown column: {name!r}") from None
+
+
+def headers(names):
+    """File headers for ``names``, in order."""
+    return [resolve(name).header for name in names]
+
+
+def view(df, names):
+    """``df`` with its columns relabelled to ``names``, without copying data.
+
+    ``df`` must have one column per name, in the same order.
+    """
+    out = df.copy(deep=False)
+    out.columns = list(names)
+    return out
+
+
+def validate(df):
+    """Check ``df`` (labelled with file headers) against the schema.
+
+    All checks are vectorised per column; every problem found is reported
+    together in one ``SchemaError``.
+    """
+    from pandas.api.types import is_numeric_dtype
+
+    problems = []
+    for header in dict.fromkeys(df.columns):
+        column = _BY_NAME.get(header)
+        if column is None or column.header != header:
+            continue
+        series = df[header]
+        present = series.notna()
+
+        if column.kind == "numeric":
+            if not is_numeric_dtype(series):
+                problems.append(f"{column.name}: expected numeric values, got {series.dtype}")
+                continue
+            low, high = column.value_range
+            bad = present & ~series.between(low, high)
+            if bad.any():
+                problems.append(
+                    f"{column.name}: {int(bad.sum())} value(s) outside {low}–{high}"
+                )
+        elif column.kind == "category":
+            bad = present & ~series.isin(column.values)
+            if bad.any():
+                unexpected = sorted(map(str, series[bad].unique()))[:5]
+                problems.append(
+                    f"{column.name}: unexpected value(s) {', '.join(unexpected)}"
+                )
+
+    if problems:
+        raise SchemaError("Dataset does not match schema:\n- " + "\n- ".join(problems))
+
+
+def check_headers(file_headers, wanted=None):
+    """Raise if any required header is missing from the data file."""
+    wanted = [c.header for c in COLUMNS] if wanted is None else wanted
+    file_headers = set(file_headers)
+    missing = [header for header in wanted if header not in file_headers]
+    if missing:
+        raise SchemaError(
+            "Dataset is missing column(s): " + ", ".join(repr(m) for m in missing)
+        )
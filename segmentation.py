@@ -0,0 +1,171 @@
+"""
+Respondent segmentation over the Likert profile.
+
+Students are clustered on their study-technique, challenge and outcome
+answers. Text Likert answers are mapped to 1–5, features missing for more
+than ``MAX_MISSING`` of respondents are left out (a median fill would make
+them a near-constant that still weighs on every distance), the remaining gaps
+are imputed with the column median, features are standardised, and segments
+are found with mini-batch k-means implemented on NumPy arrays (distances are
+computed for whole batches at once). The fitted model records which features
+were left out or imputed so the page can say so.
+
+``segment_model(k)`` is cached per dataset version, so every session shares
+one fitted model; pages only plot its per-segment aggregates.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+import schema
+from data_loader import current_version, load_data
+
+FEATURES = [
+    "freq_reading", "freq_videos", "freq_practice", "freq_group",
+    "freq_summary", "freq_flashcards", "freq_teaching",
+    "eff_reading", "eff_practice", "eff_group", "eff_flashcards", "eff_videos",
+    "obs_time", "obs_workload", "obs_distraction", "obs_environment",
+    "obs_motivation", "obs_understanding", "obs_health", "obs_internet",
+    "sleep_quality", "obstacles_index", "support_index", "learning_effectiveness",
+]
+
+# Features stored as text Likert answers (schema.LIKERT_TEXT)
+TEXT_LIKERT_FEATURES = ["obs_understanding", "obs_internet"]
+
+# Features with a larger share of missing answers are not clustered on
+MAX_MISSING = 0.3
+
+
+@dataclass
+class SegmentModel:
+    """A fitted segmentation.
+
+    ``profile`` holds the per-segment mean of every feature (on the original
+    1–5 scale, after imputation) and ``sizes`` the number of respondents per
+    segment; ``labels`` assigns each respondent to a segment. ``dropped`` and
+    ``imputed`` map the features left out or median-filled to their share of
+    missing answers.
+    """
+
+    features: list
+    labels: np.ndarray
+    centers: np.ndarray
+    profile: pd.DataFrame
+    sizes: pd.Series
+    inertia: float
+    dropped: dict
+    imputed: dict
+
+
+def encode_likert_text(df):
+    """``df`` with its text Likert features mapped to 1–5."""
+    scale = {answer: i for i, answer in enumerate(schema.LIKERT_TEXT, start=1)}
+    df = df.copy()
+    for column in TEXT_LIKERT_FEATURES:
+        df[column] = df[column].map(scale)
+    return df
+
+
+def impute(df, max_missing=MAX_MISSING):
+    """Median-impute missing answers.
+
+    Features missing for more than ``max_missing`` of respondents are dropped
+    instead. Returns ``(data, dropped, imputed)``; the last two map feature
+    names to their share of missing answers.
+    """
+    missing = df.isna().mean()
+    dropped = missing[missing > max_missing]
+    imputed = missing[(missing > 0) & (missing <= max_missing)]
+    df = df.drop(columns=dropped.index)
+    return df.fillna(df.median()), dropped.to_dict(), imputed.to_dict()
+
+
+def _squared_distances(x, centers):
+    """Squared Euclidean distances, shape ``(len(x), len(centers))``."""
+    d = (
+        (x * x).sum(axis=1)[:, None]
+        - 2 * x @ centers.T
+        + (centers * centers).sum(axis=1)[None, :]
+    )
+    return np.maximum(d, 0)
+
+
+def _init_centers(x, k, rng):
+    """k-means++ seeding."""
+    centers = [x[rng.integers(len(x))]]
+    for _ in range(1, k):
+        d = _squared_distances(x, np.array(centers)).min(axis=1)
+        probs = d / d.sum() if d.sum() > 0 else None
+        centers.append(x[rng.choice(len(x), p=probs)])
+    return np.array(centers)
+
+
+def minibatch_kmeans(x, k, batch_size=256, max_iter=100, tol=1e-4, seed=0):
+    """Mini-batch k-means (Sculley, 2010) on a standardised matrix.
+
+    Returns ``(centers, labels, inertia)``.
+    """
+    rng = np.random.default_rng(seed)
+    centers = _init_centers(x, k, rng)
+    counts = np.zeros(k)
+    batch_size = min(batch_size, len(x))
+
+    for _ in range(max_iter):
+        batch = x[rng.choice(len(x), batch_size, replace=False)]
+        nearest = _squared_distances(batch, centers).argmin(axis=1)
+
+        previous = centers.copy()
+        for j in np.unique(nearest):
+            members = batch[nearest == j]
+            counts[j] += len(members)
+            # Per-center learning rate 1/count, applied to the batch mean
+            rate = len(members) / counts[j]
+            centers[j] += rate * (members.mean(axis=0) - centers[j])
+
+        if np.abs(centers - previous).max() < tol:
+            break
+
+    distances = _squared_distances(x, centers)
+    labels = distances.argmin(axis=1)
+    inertia = float(distances[np.arange(len(x)), labels].sum())
+    return centers, labels, inertia
+
+
+@lru_cache(maxsize=16)
+def _fit(version, k, seed):
+    data, dropped, imputed = impute(
+        encode_likert_text(load_data(columns=FEATURES, version=version))
+    )
+    features = list(data.columns)
+
+    values = data.to_numpy(dtype=float)
+    mean = values.mean(axis=0)
+    std = values.std(axis=0)
+    std[std == 0] = 1.0
+    scaled = (values - mean) / std
+
+    centers, labels, inertia = minibatch_kmeans(scaled, k, seed=seed)
+
+    # Order segments by size so "Segment 1" is always the largest
+    order = np.argsort(-np.bincount(labels, minlength=k), kind="stable")
+    relabel = np.empty(k, dtype=int)
+    relabel[order] = np.arange(k)
+    labels = relabel[labels]
+    centers = centers[order] * std + mean
+
+    names = pd.Index([f"Segment {i + 1}" for i in range(k)], name="Segment")
+    profile = data.groupby(labels).mean()
+    profile.index = names[profile.index.to_numpy()]
+    sizes = pd.Series(np.bincount(labels, minlength=k), index=names, name="Students")
+
+    return SegmentModel(
+        features, labels, centers, profile, sizes, inertia, dropped, imputed
+    )
+
+
+def segment_model(k=3, seed=0, version=None):
+    """Fitted segmentation with ``k`` segments for the current dataset."""
+    return _fit(version or current_version(), k, seed)